@@ -14,10 +14,40 @@ Purpose:
 Usage:
     # Pipe raw OpenTruth JSON output into this script
     echo '{"status": "success"}' | python ot_to_bead.py
+
+    # Or stream a whole JSONL ledger (one bead per line)
+    cat gauger_log.jsonl | python ot_to_bead.py
+
+    A single pretty-printed (multi-line) document is also accepted; mixing
+    pretty-printed documents INTO a JSONL stream is not.
 """
 
-import json  # Standard library for parsing and formatting JSON
-import sys   # Standard library for reading from Stdin
+import json      # Standard library for parsing and formatting JSON
+import platform  # Standard library for detecting the interpreter (CPython vs PyPy)
+import sys       # Standard library for reading from Stdin
+
+# --- Optional Fast JSON Backend ---
+# orjson is a Rust-based encoder that serializes several times faster than the
+# stdlib. It is optional: Towns without it fall back to the stdlib seamlessly.
+# On PyPy we skip it even when installed: PyPy's C-extension bridge is slow,
+# and its JIT makes the pure-Python stdlib codec the faster choice there.
+if platform.python_implementation() == "CPython":
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+else:
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps  # bytes in -> compact JSON bytes out
+    _loads = orjson.loads  # consumes bytes directly, no str detour
+else:
+    def _dumps(obj):
+        """Serialize to compact JSON bytes (stdlib fallback)."""
+        return json.dumps(obj).encode()
+
+    _loads = json.loads  # stdlib json.loads accepts bytes too
 
 def convert_to_bead(ot_output):
     """
@@ -27,7 +57,8 @@ def convert_to_bead(ot_output):
         ot_output (dict): The raw dictionary output from verify_rig.py (e.g., findings).
 
     Returns:
-        str: A JSON-formatted string representing the fully formed Bead.
+        bytes: UTF-8 JSON bytes representing the fully formed Bead
+        (no trailing newline — the caller frames the stream).
     """
     
     # Construct the Bead Structure
@@ -39,8 +70,8 @@ def convert_to_bead(ot_output):
         "integrity": "verified_by_ot"      # A simple flag (could be a hash in the future)
     }
     
-    # Return the JSON string representation
-    return json.dumps(bead)
+    # Return the JSON bytes (fast backend when available)
+    return _dumps(bead)
 
 def main():
     """
@@ -48,24 +79,43 @@ def main():
     Reads JSON from Stdin -> Converts to Bead -> Prints JSON to Stdout.
     """
     try:
-        # Read all input from Standard Input (Stdin)
-        # This allows the script to be part of a pipeline: `cmd | this_script`
-        input_data = sys.stdin.read()
-        
-        if not input_data:
-            return # Exit silently if no input
-
-        # Parse the input string into a Python dictionary
-        ot_output = json.loads(input_data)
-        
-        # Perform the conversion
-        bead_json = convert_to_bead(ot_output)
-        
-        # Output the result to Standard Output (Stdout)
-        print(bead_json)
-        
-    except json.JSONDecodeError:
-        # Handle cases where the input isn't valid JSON
+        # Stream Stdin line by line instead of slurping it whole.
+        # This lets ONE invocation convert an entire JSONL ledger
+        # (`cat gauger_log.jsonl | this_script`), which matters doubly on
+        # PyPy: the JIT only pays off once the parse→wrap→emit loop has
+        # warmed up, so amortizing it over thousands of beads is the win.
+        # Single-document piping (`echo '{...}' | this_script`) is just the
+        # one-line case and behaves exactly as before.
+        #
+        # We stay on the binary layer end to end: stdin.buffer avoids the
+        # text wrapper's UTF-8 decode, _loads consumes the raw bytes, and
+        # the bead bytes go out via stdout.buffer — no str materializes at
+        # any point, which halves peak memory on large payloads.
+        out = sys.stdout.buffer
+        stdin = sys.stdin.buffer
+        for line in stdin:
+            if not line.strip():
+                continue  # Skip blank lines silently (trailing newlines etc.)
+
+            # Parse the line into a Python dictionary
+            try:
+                ot_output = _loads(line)
+            except ValueError:
+                # Not a complete document on one line. Pretty-printed JSON
+                # (e.g. the CLI's human-readable indent=2 output) spans
+                # multiple lines, and the pre-streaming converter accepted
+                # it — so fall back to treating the REST of stdin plus this
+                # line as one document. Only single-document streams land
+                # here; well-formed JSONL never pays for this path.
+                ot_output = _loads(line + stdin.read())
+
+            # Perform the conversion and emit one bead per input record
+            out.write(convert_to_bead(ot_output) + b"\n")
+        out.flush()
+
+    except ValueError:
+        # Handle cases where the input isn't valid JSON.
+        # (Both stdlib and orjson decode errors subclass ValueError.)
         sys.stderr.write("❌ Error: Input was not valid JSON.\n")
         sys.exit(1)
     except Exception as e:
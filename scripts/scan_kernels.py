@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+OpenTruth Scan Kernels (Numeric Hot Loops)
+------------------------------------------
+Numeric kernels backing the `opentruth_cli.py scan` command.
+
+The scan extension points listed in the CLI docstring (deepfake detection,
+metadata/manipulation analysis) all boil down to tight numeric loops over
+pixel arrays — exactly the workload where a JIT compiler pays off and the
+plain interpreter does not. This module keeps those loops isolated so:
+
+1. Agents that only call `verify` never import NumPy/Numba (imports there
+   cost hundreds of milliseconds cold — import this module lazily!).
+2. The kernels can be JIT-compiled with Numba when it is installed, with
+   `cache=True` so the compilation cost is paid once per install, not once
+   per process. Run `opentruth_cli.py warmup` after install to populate
+   the on-disk cache before any real invocation.
+3. Without Numba the same functions still run as plain NumPy Python —
+   slower, but identical results. NumPy itself is required: importing this
+   module raises ImportError when it is missing, and callers treat the
+   whole scan engine as unavailable.
+
+Usage:
+    from scan_kernels import phash64, warmup
+    h = phash64(img_u8)   # img_u8: 2D uint8 array, 32x32 grayscale
+"""
+
+import numpy as np  # Hard requirement for the kernels (callers import lazily)
+
+# --- Optional JIT Backend ---
+# Numba is optional: when present we JIT the kernels with an on-disk cache;
+# when absent, _njit is a no-op decorator and the pure-NumPy path runs.
+try:
+    from numba import njit as _numba_njit
+
+    def _njit(func):
+        # cache=True persists the compiled machine code next to this file,
+        # so the JIT latency is a one-time (per install) cost.
+        # fastmath=True is safe here: the DCT feeds a sign comparison, so
+        # relaxed float ordering cannot flip the resulting hash in practice.
+        return _numba_njit(cache=True, fastmath=True)(func)
+
+    JIT_ENABLED = True
+except ImportError:
+    def _njit(func):
+        return func
+
+    JIT_ENABLED = False
+
+# Side length of the input tile and of the low-frequency DCT block we keep.
+# 32x32 input / 8x8 block is the standard pHash configuration.
+_TILE = 32
+_BLOCK = 8
+
+@_njit
+def _dct_2d(block):
+    """
+    Naive 2D DCT-II over a float64 square block.
+
+    O(n^3) per axis, which is fine for a 32x32 tile and keeps the kernel
+    free of FFT library calls (Numba nopython mode compiles plain loops).
+    """
+    n = block.shape[0]
+    coeffs = np.empty((n, n), dtype=np.float64)
+    for u in range(n):
+        for v in range(n):
+            acc = 0.0
+            for x in range(n):
+                for y in range(n):
+                    acc += block[x, y] * np.cos((2 * x + 1) * u * np.pi / (2 * n)) \
+                                       * np.cos((2 * y + 1) * v * np.pi / (2 * n))
+            coeffs[u, v] = acc
+    return coeffs
+
+@_njit
+def phash64(img_u8):
+    """
+    Computes a 64-bit DCT-based perceptual hash of a 32x32 grayscale tile.
+
+    Hashes that differ by only a few bits indicate visually-similar images,
+    which is what the Spotter/Watchdog manipulation checks compare against.
+
+    Args:
+        img_u8 (np.ndarray): 2D uint8 array of shape (32, 32).
+
+    Returns:
+        np.uint64: The perceptual hash.
+    """
+    # DCT the tile and keep the low-frequency 8x8 corner (minus the DC term,
+    # which only encodes overall brightness).
+    coeffs = _dct_2d(img_u8.astype(np.float64))
+    low = coeffs[:_BLOCK, :_BLOCK].copy()
+    low[0, 0] = 0.0
+
+    # Each bit: is this coefficient above the block mean?
+    mean = low.sum() / (_BLOCK * _BLOCK)
+    h = np.uint64(0)
+    bit = np.uint64(1)
+    for u in range(_BLOCK):
+        for v in range(_BLOCK):
+            if low[u, v] > mean:
+                h |= bit
+            bit = np.uint64(bit << np.uint64(1))
+    return h
+
+def warmup():
+    """
+    Triggers JIT compilation of every kernel on a dummy input.
+
+    Run once after install (via `opentruth_cli.py warmup`) so the Numba
+    on-disk cache is populated before the first real scan — otherwise the
+    first agent to scan pays the full compile latency.
+    """
+    phash64(np.zeros((_TILE, _TILE), dtype=np.uint8))
+    return JIT_ENABLED
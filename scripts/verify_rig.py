@@ -27,17 +27,57 @@ The Protocol (The Contract):
 
 Usage:
 ------
+    # Single verification (one target, one role):
     python verify_rig.py --target /path/to/rig --role gauger
     python verify_rig.py --target /path/to/rig --role spotter
     python verify_rig.py --target /path/to/rig --role watchdog
+
+    # Parallel sweep (every target x every role, process pool):
+    python verify_rig.py --targets ./Rig-A ./Rig-B --roles gauger spotter --jobs 4
+
+    # Same sweep on a single asyncio event loop instead of a pool:
+    python verify_rig.py --targets ./Rig-A ./Rig-B --roles gauger --async
+
+Options:
+--------
+    --jobs N                        Worker processes (pool) or concurrent
+                                    hooks (async). Defaults to the CPU count.
+    --async                         Run the sweep on one event loop.
+    --ledger-format {jsonl,framed}  Proof ledger encoding (default: jsonl).
+                                    See iter_framed_ledger for the reader.
 """
 
-import argparse     # Standard library for parsing command-line flags (e.g., --target)
+import atexit       # Standard library for flush-on-exit hooks (ledger durability)
 import json         # Standard library for creating structured data logs
-import datetime     # Standard library for accurate timestamping (UTC)
+import functools    # Standard library for caching (timestamp formatting)
+import time         # Standard library for accurate timestamping (UTC)
 import os           # Standard library for file system navigation
 import sys          # Standard library for system exit codes
 import subprocess   # Standard library for running external commands (the delegation part)
+import collections  # Standard library for the bounded output capture (deque)
+import queue        # Standard library for the proof hand-off to the writer thread
+import selectors    # Standard library for multiplexing the hook's output pipes
+import signal       # Standard library for flushing the ledger on SIGINT/SIGTERM
+import stat         # Standard library for decoding st_mode bits (hook lookup)
+import struct       # Standard library for length-prefix framing (framed ledger)
+import threading    # Standard library for the background ledger-writer thread
+
+# --- Optional Fast JSON Backend ---
+# Proofs are serialized once per verification; orjson (a Rust-based encoder)
+# does this several times faster than the stdlib and emits bytes directly,
+# which lets us append to the ledger without a separate UTF-8 encode step.
+# It is optional: Towns without it fall back to the stdlib seamlessly.
+try:
+    import orjson
+
+    _dumps = orjson.dumps  # Returns bytes
+except ImportError:
+    def _dumps(obj):
+        """Serialize to compact JSON bytes (stdlib fallback)."""
+        # Compact separators match orjson's output byte for byte — which
+        # the spliced-proof path (_proof_prefix/log_proof) relies on: glued
+        # fragments must look exactly like one encode of the full dict.
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 # --- Configuration Section ---
 
@@ -51,6 +91,310 @@ CENTRAL_PROOFS_DIR = os.path.join(TOWN_ROOT, "data/truth_ledger")
 if not os.path.exists(CENTRAL_PROOFS_DIR):
     CENTRAL_PROOFS_DIR = os.path.abspath("history/proofs")
 
+# Role -> hook script name (The Protocol Contract). Built once: _delegate
+# used to rebuild this dict on every single verification.
+_SCRIPT_MAP = {
+    "gauger": "verify_logic",
+    "spotter": "verify_visual",
+    "watchdog": "verify_security"
+}
+
+# Every known agent role, for flag validation and per-role tables below.
+_ROLES = tuple(_SCRIPT_MAP)
+
+# Hook extensions accepted by find_executable, in priority order.
+# Empty string "" matches a script with no extension (common in Linux).
+_EXTS = ("", ".sh", ".py", ".rb", ".js")
+
+# Per-role ledger paths, resolved once at import. log_proof used to re-join
+# this path on every call; over a 10k-rig sweep that's 10k avoidable joins.
+_PROOF_PATHS = {
+    role: os.path.join(CENTRAL_PROOFS_DIR, f"{role}_log.jsonl")
+    for role in _ROLES
+}
+
+@functools.lru_cache(maxsize=1024)
+def _proof_prefix(role, target_name):
+    """
+    Pre-encodes the invariant head of a proof record for a (role, rig) pair.
+
+    Every proof in a sweep repeats the same agent string, rig name and role;
+    encoding them once and splicing the per-proof tail after the returned
+    bytes (which end mid-object, comma-ready) halves the dict encoding work
+    per proof. Both JSON backends emit objects as '{...}', so the slice
+    arithmetic in log_proof holds for either.
+    """
+    head = _dumps({
+        "agent": f"OpenTruth-{role.capitalize()}",  # e.g. OpenTruth-Watchdog
+        "target_rig": target_name,
+        "role": role
+    })
+    return head[:-1] + b","  # '{"agent":...,"role":"x"' + ',' — open-ended
+
+@functools.lru_cache(maxsize=1024)
+def _rig_name(target):
+    """
+    Resolves a target path to its Rig identifier (the folder name).
+
+    os.path.abspath re-derives the working directory for relative paths,
+    so repeated proofs against the same Rig — the normal case in a sweep —
+    would re-resolve the same path over and over. Callers normalize to an
+    absolute path up front (see run_delegated_check/run_batch), which hits
+    the cheap basename-only branch; the cache covers everything else.
+    """
+    if os.path.isabs(target):
+        return os.path.basename(target.rstrip(os.sep)) or target
+    return os.path.basename(os.path.abspath(target))
+
+@functools.lru_cache(maxsize=2)
+def _format_second(epoch_second):
+    """
+    Formats an integer epoch second as an ISO-8601 UTC prefix (no fraction).
+
+    Proofs emitted back-to-back in a sweep share the same wall-clock second,
+    so caching the expensive gmtime+strftime part means it runs once per
+    second instead of once per proof. maxsize=2 covers the boundary where
+    two adjacent seconds interleave.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(epoch_second))
+
+def _utc_timestamp():
+    """
+    Returns the current UTC time as an ISO-8601 string (microsecond precision).
+
+    Equivalent to datetime.now(UTC).isoformat(), but built from time_ns() plus
+    the cached per-second formatter above — no datetime object allocation or
+    tzinfo lookup per proof.
+    """
+    seconds, ns_remainder = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_format_second(seconds)}.{ns_remainder // 1000:06d}+00:00"
+
+class _LedgerWriter:
+    """
+    Append-only sink for the Central Ledger, drained off the hot path.
+
+    Two layers keep ledger I/O away from the verification critical path:
+
+    1. A lazily-started daemon thread owns all file handles. log_proof just
+       enqueues (role, encoded line) and returns — the delegation loop never
+       blocks on the VFS.
+    2. The drainer coalesces whatever is queued (up to _BATCH_MAX messages,
+       waiting up to _BATCH_WAIT for stragglers), groups lines by role, and
+       lands each group with ONE write per batch on a persistent 64KB-
+       buffered "ab" handle. A sweep of thousands of proofs thus costs a
+       handful of write syscalls instead of an open/write/close per proof.
+
+    close() (wired to atexit and the signal handlers below) stops the
+    thread and drains every queued proof before the handles go away, so no
+    proof is lost on a clean or signalled exit.
+    """
+
+    # Batch tuning: bounded so one huge sweep can't starve the file of
+    # updates, with a short straggler window to merge back-to-back proofs.
+    _BATCH_MAX = 512
+    _BATCH_WAIT = 0.05  # seconds
+    _STOP = object()    # Sentinel that tells the drainer to shut down
+
+    def __init__(self):
+        # role -> open BufferedWriter; touched ONLY by the drainer thread
+        # (and by close(), after the drainer has been joined).
+        self._handles = {}
+        self._queue = queue.Queue()
+        self._thread = None
+        self._closed = False
+        # First OSError the drainer hit, if any. Proofs are "the most
+        # important step" (see module docstring): a broken ledger must fail
+        # the run, so write()/close() re-raise this on the main thread
+        # instead of letting a healthy-looking process discard proofs.
+        self.error = None
+        # Ledger encoding: "jsonl" (default, human-greppable) or "framed"
+        # (u32-length-prefixed records in a .frames file — appenders skip
+        # the newline handling and readers can mmap + jump record to
+        # record without scanning for separators). Set via --ledger-format
+        # before the first proof.
+        self.format = "jsonl"
+
+    def _path_for(self, role):
+        """Returns the ledger file path for a role in the active format."""
+        if self.format == "framed":
+            return os.path.join(CENTRAL_PROOFS_DIR, f"{role}_log.frames")
+        return _PROOF_PATHS.get(role) \
+            or os.path.join(CENTRAL_PROOFS_DIR, f"{role}_log.jsonl")
+
+    def write(self, role, line):
+        """
+        Queues one encoded proof line (bytes, no trailing newline) for the
+        role's ledger file. Returns the file path for caller-side reporting.
+        """
+        if self.error is not None:
+            # The drainer already failed; queueing more proofs would only
+            # hide the loss. Raise here like the baseline's inline write
+            # did, so the verification exits nonzero.
+            raise self.error
+        if self._thread is None:
+            # Lazy start: processes that never log (e.g. --help) never pay
+            # for a thread.
+            self._thread = threading.Thread(target=self._drain, daemon=True)
+            self._thread.start()
+        self._queue.put((role, line))
+        return self._path_for(role)
+
+    def _handle_for(self, role):
+        """Returns (opening if needed) the persistent handle for a role."""
+        handle = self._handles.get(role)
+        if handle is None:
+            # Lazy Initialization: create the ledger directory and the
+            # role-specific handle only when the first proof arrives.
+            os.makedirs(CENTRAL_PROOFS_DIR, exist_ok=True)
+            handle = open(self._path_for(role), "ab", buffering=1 << 16)
+            self._handles[role] = handle
+        return handle
+
+    def _drain(self):
+        """Drainer thread: batch queued proofs and write them per role."""
+        while True:
+            batch = [self._queue.get()]
+            stopping = batch[0] is self._STOP
+            # Coalesce stragglers into the same batch.
+            while not stopping and len(batch) < self._BATCH_MAX:
+                try:
+                    item = self._queue.get(timeout=self._BATCH_WAIT)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            # Group by role so each ledger file gets a single write call.
+            by_role = {}
+            for entry in batch:
+                if entry is self._STOP:
+                    continue
+                role, line = entry
+                by_role.setdefault(role, []).append(line)
+            for role, lines in by_role.items():
+                if self.format == "framed":
+                    # One write of concatenated <u32 length><payload> frames.
+                    data = b"".join(
+                        struct.pack("<I", len(line)) + line for line in lines)
+                else:
+                    data = b"\n".join(lines) + b"\n"
+                try:
+                    self._handle_for(role).write(data)
+                except OSError as e:
+                    # Don't die silently on a daemon thread: report once,
+                    # remember the error, and keep consuming the queue so
+                    # close() can still join us. write()/close() re-raise
+                    # on the main thread and fail the run.
+                    if self.error is None:
+                        self.error = e
+                        sys.stderr.write(f"❌ Ledger write failed: {e}\n")
+
+            if stopping:
+                return
+
+    def close(self):
+        """
+        Stops the drainer (flushing everything queued) and closes all
+        handles. Wired to atexit; also used by the signal handlers.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+        for handle in self._handles.values():
+            try:
+                handle.close()  # Flushes the 64KB buffer — can fail too
+            except OSError as e:
+                if self.error is None:
+                    self.error = e
+                    sys.stderr.write(f"❌ Ledger write failed: {e}\n")
+        self._handles.clear()
+        if self.error is not None:
+            # Re-raise so the failure is visible on whichever thread closed
+            # us. From the atexit hook this also turns the process exit
+            # code nonzero — a run whose proofs never landed must not
+            # report success.
+            raise self.error
+
+# One writer per process; atexit guarantees queued and buffered proofs hit
+# the disk before the interpreter exits.
+#
+# Trade-off of the queueing + 64KB write coalescing: a hard crash can lose
+# the still-buffered tail of proofs. Acceptable for a .jsonl log that is
+# fully re-derivable by re-running the sweep — but a plain SIGINT/SIGTERM
+# (the common way a sweep gets stopped) shouldn't count as a hard crash,
+# so we drain on those too before re-delivering the signal.
+_LEDGER = _LedgerWriter()
+atexit.register(_LEDGER.close)
+
+def iter_framed_ledger(path):
+    """
+    Iterates a framed ledger file, yielding (offset, payload_bytes) pairs.
+
+    The counterpart to the writer's "framed" mode: the file is memory-
+    mapped and records are visited by hopping length prefixes — no
+    separator scan, no copy until the caller decodes a payload it wants
+    (e.g. with orjson.loads).
+
+    Args:
+        path (str): Path to a {role}_log.frames file.
+
+    Yields:
+        tuple: (byte offset of the frame, raw JSON payload bytes).
+    """
+    import mmap  # Reader-only dependency; keep it off the writer's imports
+
+    with open(path, "rb") as f:
+        # An empty ledger has nothing to map (mmap rejects length 0).
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            offset = 0
+            end = len(view)
+            while offset + 4 <= end:
+                (length,) = struct.unpack_from("<I", view, offset)
+                if offset + 4 + length > end:
+                    break  # Truncated trailing frame (e.g. hard crash): stop
+                yield offset, bytes(view[offset + 4:offset + 4 + length])
+                offset += 4 + length
+
+def _flush_on_signal(signum, frame):
+    """Signal handler: drain the ledger, then die by the original signal."""
+    try:
+        _LEDGER.close()
+    except OSError:
+        pass  # Already reported; death-by-signal below is nonzero anyway
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+for _sig in (signal.SIGINT, signal.SIGTERM):
+    # Respect any handler an embedding process installed before importing us.
+    if signal.getsignal(_sig) in (signal.SIG_DFL, signal.default_int_handler):
+        signal.signal(_sig, _flush_on_signal)
+
+def _drain_ledger():
+    """
+    Flushes every queued proof to disk, reporting whether all of them landed.
+
+    main() calls this before deciding the exit code: exceptions raised from
+    the atexit hook are printed but ignored by the interpreter (the process
+    would still exit 0), so a broken ledger has to be folded into the
+    verification outcome explicitly.
+
+    Returns:
+        bool: True if the ledger drained cleanly, False if a write failed.
+    """
+    try:
+        _LEDGER.close()
+    except OSError:
+        return False  # The writer already reported the error on stderr
+    return True
+
 def log_proof(target, role, action, status, details):
     """
     Logs the execution result to the Central Ledger.
@@ -66,41 +410,53 @@ def log_proof(target, role, action, status, details):
         details (dict): The technical output (stdout, stderr, exit_code).
     """
     # Use UTC time to avoid timezone confusion across distributed teams.
-    timestamp = datetime.datetime.now(datetime.UTC).isoformat()
-    
+    timestamp = _utc_timestamp()
+
     # We use the folder name (e.g., "Rig-A") as the identifier.
-    target_name = os.path.basename(os.path.abspath(target))
+    target_name = _rig_name(target)
 
-    proof = {
+    # The agent/target_rig/role fields repeat identically across every
+    # proof of a (role, rig) pair, so their encoded form comes from the
+    # cache and only the per-proof fields get serialized here. Gluing
+    # "...role-fields," + "timestamp..." back together yields exactly the
+    # record _dumps would have produced for the full dict (the invariant
+    # keys just lead instead of the timestamp).
+    variable = _dumps({
         "timestamp": timestamp,
-        "agent": f"OpenTruth-{role.capitalize()}", # e.g. OpenTruth-Watchdog
-        "target_rig": target_name,
-        "role": role,
         "action": action,
         "status": status,
         "details": details
-    }
-    
-    # Create the ledger directory if it doesn't exist (Lazy Initialization)
-    os.makedirs(CENTRAL_PROOFS_DIR, exist_ok=True)
-    
-    # Log to a role-specific file (e.g., watchdog_log.jsonl). 
-    # This segregation helps human auditors focus on specific concerns.
-    proof_file = os.path.join(CENTRAL_PROOFS_DIR, f"{role}_log.jsonl")
-    
-    with open(proof_file, "a") as f:
-        f.write(json.dumps(proof) + "\n")
-    
-    print(f"📝 {role.capitalize()} Proof logged: {action} -> {status}")
-    print(f"   📍 Location: {proof_file}")
+    })
+    proof_line = _proof_prefix(role, target_name) + variable[1:]
+
+    # Hand the encoded record to the persistent ledger writer. Proofs land
+    # in a role-specific file (e.g., watchdog_log.jsonl) — this segregation
+    # helps human auditors focus on specific concerns.
+    proof_file = _LEDGER.write(role, proof_line)
 
+    # Console feedback is only useful to a human watching a terminal; agents
+    # piping to the data plane don't need it, and tty-less writes just slow
+    # the sweep down.
+    if sys.stdout.isatty():
+        sys.stdout.write(
+            f"📝 {role.capitalize()} Proof logged: {action} -> {status}\n"
+            f"   📍 Location: {proof_file}\n")
+
+@functools.lru_cache(maxsize=256)
 def find_executable(truth_dir, base_name):
     """
     Helper function to find the correct script file.
-    
+
     It supports multiple languages/extensions, checking them in order.
     The script MUST be marked as executable (chmod +x) to be picked up.
 
+    Memoized: a sweep probes the same (truth_dir, base_name) pair once per
+    role and long-lived callers repeat lookups, so cache hits turn the
+    directory scan into a dict lookup. main() clears the cache on entry so
+    a fresh invocation never trusts stale results; pool workers each carry
+    their own (empty) cache, which is correct since they scan disjoint
+    pairs anyway.
+
     Args:
         truth_dir (str): Path to the .truth folder.
         base_name (str): The expected script name (e.g., "verify_logic").
@@ -108,126 +464,587 @@ def find_executable(truth_dir, base_name):
     Returns:
         str | None: The absolute path to the script, or None if not found.
     """
-    # We check these extensions in priority order.
-    # Empty string "" checks for a script with no extension (common in Linux).
-    extensions = ["", ".sh", ".py", ".rb", ".js"]
-    
-    for ext in extensions:
-        script_path = os.path.join(truth_dir, base_name + ext)
-        # Check if file exists AND is executable by the user
-        if os.path.isfile(script_path) and os.access(script_path, os.X_OK):
-            return script_path
-            
-    return None
+    # Candidates are base_name + each _EXTS entry, in priority order.
+    # Probing each candidate with isfile+access would cost up to 10 stat
+    # syscalls; one scandir pass reads the whole directory in a single trip
+    # through the kernel and the DirEntry stat results come for free.
+    priority = {base_name + ext: i for i, ext in enumerate(_EXTS)}
 
-def run_delegated_check(target_path, role):
+    best = None
+    try:
+        for entry in os.scandir(truth_dir):
+            rank = priority.get(entry.name)
+            if rank is None:
+                continue
+            # One stat per matching candidate answers both questions —
+            # regular file? executable? — where isfile+os.access would walk
+            # the path twice. Symlinks are followed (the DirEntry caches
+            # this stat too): a hook that is a link to a shared script is
+            # judged by its target, exactly like isfile/access did.
+            try:
+                st = entry.stat()
+            except OSError:
+                continue  # Raced deletion / unreadable entry: not a hook
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            # Executable bits only mean something on POSIX; elsewhere a
+            # regular file with a matching name is the best we can do.
+            if os.name == "posix" and not st.st_mode & 0o111:
+                continue
+            if best is None or rank < best[0]:
+                best = (rank, entry.path)
+    except OSError:
+        # No .truth directory, .truth is a plain file (NotADirectoryError),
+        # unreadable dir (PermissionError), ... — every "can't enumerate
+        # the hook dir" case means the same thing isfile/access said before:
+        # no hook.
+        return None
+
+    return best[1] if best else None
+
+# Ledger capture keeps at most this many trailing lines per stream. The
+# console tee still shows EVERYTHING live; the cap only bounds what lands
+# in the proof record, so a hook dumping megabytes of test logs can't blow
+# up our memory or the ledger.
+_CAPTURE_MAX_LINES = 1000
+
+class _BoundedCapture:
     """
-    The Core Logic: Finds and runs the specific verification script for the role.
-    
+    Collects a stream's trailing lines with O(1) memory in stream length.
+
+    Whole lines go into a deque(maxlen=_CAPTURE_MAX_LINES); the partial
+    line at the buffer edge waits in `pending` until its newline arrives.
+    When older lines fall off the deque, text() says how many were dropped.
+    """
+
+    def __init__(self):
+        self.lines = collections.deque(maxlen=_CAPTURE_MAX_LINES)
+        self.pending = bytearray()
+        self.total_lines = 0
+
+    def feed(self, chunk):
+        """Absorbs one raw chunk from the pipe."""
+        self.pending += chunk
+        if b"\n" in chunk:
+            parts = self.pending.split(b"\n")
+            self.lines.extend(parts[:-1])
+            self.total_lines += len(parts) - 1
+            # The tail after the last newline is the new partial line.
+            del self.pending[:]
+            self.pending += parts[-1]
+
+    def text(self):
+        """Returns the captured tail, decoded once, truncation-marked."""
+        lines = list(self.lines)
+        if self.pending:
+            lines.append(bytes(self.pending))
+        dropped = self.total_lines - len(self.lines)
+        if dropped > 0:
+            lines.insert(0, b"... [%d earlier lines omitted] ..." % dropped)
+        return b"\n".join(lines).decode("utf-8", "replace").strip()
+
+def _spawn_hook(script_path, target_path):
+    """
+    Launches a verification hook with piped stdout/stderr.
+
+    On POSIX this uses os.posix_spawn, which avoids fork()'s page-table
+    copy of the parent — a cost that grows with the Python process RSS and
+    is paid per hook in a town-wide sweep. (subprocess only takes its own
+    posix_spawn fast path when cwd is unset, so we chdir around the spawn
+    ourselves to keep the "hook runs at the Rig root" contract.)
+
     Args:
-        target_path (str): Path to the Rig.
-        role (str): 'gauger', 'spotter', or 'watchdog'.
-        
+        script_path (str): Absolute path to the hook executable.
+        target_path (str): The Rig root to run the hook in.
+
     Returns:
-        bool: True if the delegated script exited with code 0 (Success).
+        tuple: (wait_fn, stdout_reader, stderr_reader) where wait_fn()
+        blocks and returns the exit code, and the readers are binary
+        file objects over the hook's output pipes.
     """
-    print(f"🔎 {role.capitalize()} checking: {target_path}")
-    
-    truth_dir = os.path.join(target_path, ".truth")
-    
+    if hasattr(os, "posix_spawn"):
+        out_read, out_write = os.pipe()
+        err_read, err_write = os.pipe()
+        # Wire the child's stdout/stderr to our pipes; close the read ends
+        # in the child so EOF propagates when the hook exits.
+        file_actions = [
+            (os.POSIX_SPAWN_DUP2, out_write, 1),
+            (os.POSIX_SPAWN_DUP2, err_write, 2),
+            (os.POSIX_SPAWN_CLOSE, out_read),
+            (os.POSIX_SPAWN_CLOSE, err_read),
+        ]
+        # posix_spawn has no cwd argument: hop into the Rig for the spawn
+        # and hop back. The process is single-threaded here, so this is safe.
+        old_cwd = os.getcwd()
+        os.chdir(target_path)
+        try:
+            pid = os.posix_spawn(script_path, [script_path], os.environ,
+                                 file_actions=file_actions)
+        finally:
+            os.chdir(old_cwd)
+            # Parent must drop the write ends or it never sees EOF.
+            os.close(out_write)
+            os.close(err_write)
+
+        def wait():
+            _pid, status = os.waitpid(pid, 0)
+            return os.waitstatus_to_exitcode(status)
+
+        return (wait,
+                os.fdopen(out_read, "rb", 1 << 16),
+                os.fdopen(err_read, "rb", 1 << 16))
+
+    # Fallback (non-POSIX platforms): plain Popen, same pipe semantics.
+    # Keep this call shape spawn-friendly if it ever runs on a POSIX build
+    # without os.posix_spawn: no preexec_fn, no restore_signals tricks, and
+    # close_fds left at its True default — the exact constraints under
+    # which CPython's subprocess picks its own posix_spawn fast path
+    # (subprocess._USE_POSIX_SPAWN) whenever cwd permits.
+    proc = subprocess.Popen(
+        [script_path],
+        cwd=target_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        close_fds=True,
+        bufsize=1 << 16
+    )
+    return proc.wait, proc.stdout, proc.stderr
+
+def _resolve_hook(target_path, role, announce=None):
+    """
+    Maps a (target, role) pair to its executable hook, reporting failures.
+
+    Shared by the blocking and asyncio delegation paths so the Protocol
+    Contract (role -> script name, missing-target vs missing-hook
+    distinction) lives in exactly one place.
+
+    Args:
+        target_path (str): Absolute path to the Rig.
+        role (str): The agent role.
+        announce (list | None): When given, console lines are appended here
+            instead of written — the caller then emits ONE buffered write.
+            print() takes the stdout lock and flushes per call, which turns
+            into real contention once sweep workers share the terminal.
+
+    Returns:
+        tuple: (script_path, None) on success, or (None, result) where
+        result is the (success, status, details) triple to return/log.
+    """
+    emit = announce.append if announce is not None \
+        else (lambda message: sys.stdout.write(message + "\n"))
+
+    # Plain concat, not os.path.join: target_path is normalized absolute by
+    # the callers, and join's genericity (type checks, separator probing)
+    # is pure overhead on this per-verification path.
+    truth_dir = target_path + os.sep + ".truth"
+
     # Map the Role to the Script Name (The Protocol Contract)
-    script_map = {
-        "gauger": "verify_logic",
-        "spotter": "verify_visual",
-        "watchdog": "verify_security"
-    }
-    
-    script_name = script_map.get(role)
+    script_name = _SCRIPT_MAP.get(role)
     if not script_name:
-        print(f"❌ Unknown role: {role}")
-        return False
-    
-    # 1. Locate the Hook
+        emit(f"❌ Unknown role: {role}")
+        return None, (False, "error", None)
+
     script_path = find_executable(truth_dir, script_name)
-    
     if not script_path:
+        # Only now — on the failure path — do we stat the target itself, to
+        # tell "the whole Rig is missing" apart from "the Rig has no hook".
+        # The success path never pays that extra syscall: the scandir inside
+        # find_executable was the existence check.
+        if not os.path.isdir(target_path):
+            emit(f"❌ Target path not found: {target_path}")
+            return None, (False, "failure", None)
+
         # If the hook is missing, we fail the verification.
         # This enforces that Rigs MUST be verifiable to participate in the Town.
         error_msg = f"❌ No executable '{script_name}' found in {truth_dir}"
-        print(error_msg)
-        log_proof(target_path, role, f"delegate_{role}", "failure", {"error": "missing_hook", "msg": error_msg})
-        return False
-        
-    print(f"🚀 Executing: {script_path}")
-    
+        emit(error_msg)
+        return None, (False, "failure", {"error": "missing_hook", "msg": error_msg})
+
+    return script_path, None
+
+def _delegate(target_path, role):
+    """
+    The Core Logic: Finds and runs the specific verification script for the role.
+
+    Deliberately does NOT touch the ledger: in the parallel sweep mode the
+    worker processes run this and hand their results back, so all proofs
+    are written by the parent's single ledger writer (one file, one owner).
+
+    Args:
+        target_path (str): Path to the Rig.
+        role (str): 'gauger', 'spotter', or 'watchdog'.
+
+    Returns:
+        tuple: (success, status, details) where success is True if the
+        delegated script exited with code 0, status is the ledger status
+        string, and details is the proof detail dict — or None when there
+        is nothing worth logging (unknown role / missing target).
+    """
+    # Console lines for this verification are batched into one write —
+    # see the announce note on _resolve_hook.
+    lines = [f"🔎 {role.capitalize()} checking: {target_path}"]
+
+    script_path, failure = _resolve_hook(target_path, role, announce=lines)
+    if script_path is None:
+        sys.stdout.write("\n".join(lines) + "\n")
+        return failure
+
+    lines.append(f"🚀 Executing: {script_path}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
     # 2. Execute the Hook
     try:
-        # subprocess.run is the safest way to execute external commands.
-        # cwd=target_path: We switch the "Current Working Directory" to the Rig root.
-        #   This is crucial! It allows the script to reference files relatively (e.g., ./tests/).
-        # capture_output=True: We grab what the script prints so we can log it.
-        result = subprocess.run(
-            [script_path], 
-            cwd=target_path, 
-            capture_output=True,
-            text=True
-        )
-        
-        # Structure the details for the log
+        # We drain both pipes as bytes while the hook runs (rather than
+        # buffering everything like subprocess.run(capture_output=True)
+        # would), teeing each chunk straight to the console so the calling
+        # Agent sees output live. Decoding happens once, at log time.
+        # The hook runs with the Rig root as its working directory — this is
+        # crucial! It allows the script to reference files relatively
+        # (e.g., ./tests/).
+        wait, hook_stdout, hook_stderr = _spawn_hook(script_path, target_path)
+
+        # Multiplex both pipes with selectors so a hook that fills its stderr
+        # buffer can't deadlock us while we block on stdout (or vice versa).
+        # Captures are line-bounded (_BoundedCapture), so memory stays O(1)
+        # in hook verbosity while the console tee still shows everything.
+        cap_out = _BoundedCapture()
+        cap_err = _BoundedCapture()
+        sel = selectors.DefaultSelector()
+        sel.register(hook_stdout, selectors.EVENT_READ, (cap_out, sys.stdout.buffer))
+        sel.register(hook_stderr, selectors.EVENT_READ, (cap_err, sys.stderr.buffer))
+
+        while sel.get_map():
+            for key, _events in sel.select():
+                chunk = key.fileobj.read1(1 << 16)
+                if not chunk:
+                    # EOF on this pipe — the child closed its end.
+                    sel.unregister(key.fileobj)
+                    key.fileobj.close()
+                    continue
+                capture, tee = key.data
+                capture.feed(chunk)
+                tee.write(chunk)  # Live echo, no decode round-trip
+                tee.flush()
+        sel.close()
+
+        exit_code = wait()
+
+        # Structure the details for the log (single decode, at the very end)
         details = {
             "hook": os.path.basename(script_path),
-            "exit_code": result.returncode,
-            "stdout": result.stdout.strip(), # Trim whitespace
-            "stderr": result.stderr.strip()
+            "exit_code": exit_code,
+            "stdout": cap_out.text(),
+            "stderr": cap_err.text()
         }
-        
+
         # Determine Status: 0 is the universal Unix code for "Success".
-        status = "success" if result.returncode == 0 else "failure"
-        
-        # Log the Proof (This is the most important step!)
-        log_proof(target_path, role, f"delegate_{role}", status, details)
-        
-        # Echo output to console so the calling Agent can see what happened immediately.
-        if result.stdout: print(f"--- Output ---\n{result.stdout}")
-        if result.stderr: print(f"--- Errors ---\n{result.stderr}")
-        
-        return result.returncode == 0
+        status = "success" if exit_code == 0 else "failure"
+
+        return exit_code == 0, status, details
 
     except Exception as e:
         # Handle unexpected crashes (e.g., Permission Denied, OS Error)
         print(f"❌ Execution Error: {e}")
-        log_proof(target_path, role, f"delegate_{role}", "error", {"error": str(e)})
-        return False
+        return False, "error", {"error": str(e)}
+
+def run_delegated_check(target_path, role):
+    """
+    Runs one delegated verification AND records its proof.
+
+    This is the single-target entry point; the parallel sweep in run_batch
+    calls _delegate directly and logs all proofs from the parent instead.
+
+    Returns:
+        bool: True if the delegated script exited with code 0 (Success).
+    """
+    # Normalize ONCE: _delegate (cwd, scans) and log_proof (rig naming)
+    # both want an absolute path, and re-deriving it per call stacks
+    # getcwd/normpath work on the hot path for no reason.
+    target_path = os.path.abspath(target_path)
+    success, status, details = _delegate(target_path, role)
+    if details is not None:
+        # Log the Proof (This is the most important step!)
+        log_proof(target_path, role, f"delegate_{role}", status, details)
+    return success
+
+def run_batch(targets, roles, jobs):
+    """
+    Verifies many (target, role) pairs concurrently.
+
+    Each delegated hook is an independent subprocess, so a town-wide sweep
+    serializing them end-to-end turns a max() of hook durations into a
+    sum(). The pairs are fanned out over a process pool instead; workers
+    run _delegate and return their proof data, and the parent writes every
+    proof through its own ledger writer — keeping one writer per ledger
+    file no matter how many workers run.
+
+    Args:
+        targets (list[str]): Rig paths to verify.
+        roles (list[str]): Roles to run against each target.
+        jobs (int): Worker process count.
+
+    Returns:
+        bool: True if every verification succeeded.
+    """
+    # Imported here, not at module top: the single-target path (the common
+    # case) shouldn't pay the concurrent.futures import chain.
+    import concurrent.futures
+
+    # Absolute paths, resolved once here — workers and the ledger both
+    # reuse them without re-deriving the cwd per (target, role) pair.
+    targets = [os.path.abspath(target) for target in targets]
+    tasks = [(target, role) for target in targets for role in roles]
+    failures = 0
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(_delegate, target, role): (target, role)
+            for target, role in tasks
+        }
+        # Log proofs as results land, not in submission order — the ledger
+        # timestamps then reflect actual completion.
+        for future in concurrent.futures.as_completed(futures):
+            target, role = futures[future]
+            try:
+                success, status, details = future.result()
+            except Exception as e:
+                # A worker blowing up is that verification failing, not a
+                # reason to abandon the rest of the sweep (and lose their
+                # proofs). Record an error proof and keep draining.
+                print(f"❌ [{role}] Worker error for {target}: {e}")
+                success, status, details = False, "error", {"error": str(e)}
+            if details is not None:
+                log_proof(target, role, f"delegate_{role}", status, details)
+            if not success:
+                failures += 1
+
+    print(f"🏁 Sweep complete: {len(tasks) - failures}/{len(tasks)} verifications passed.")
+    return failures == 0
+
+def run_batch_async(targets, roles, jobs):
+    """
+    Verifies many (target, role) pairs on one asyncio event loop.
+
+    Alternative to run_batch's process pool: hooks are I/O-bound (they
+    shell out and wait inside the child), so a single event loop that
+    multiplexes hundreds of pipe reads through the OS readiness interface
+    is lighter than one worker process per concurrent hook. Select with
+    --async; concurrency is still bounded by --jobs via a semaphore.
+
+    Args:
+        targets (list[str]): Rig paths to verify.
+        roles (list[str]): Roles to run against each target.
+        jobs (int): Maximum concurrently-running hooks.
+
+    Returns:
+        bool: True if every verification succeeded.
+    """
+    # Lazy import: the single-target path never pays for asyncio.
+    import asyncio
+
+    targets = [os.path.abspath(target) for target in targets]
+    tasks = [(target, role) for target in targets for role in roles]
+
+    async def _drain(stream, capture):
+        """Feeds one pipe into a bounded capture, chunk by chunk."""
+        while True:
+            chunk = await stream.read(1 << 16)
+            if not chunk:
+                return
+            capture.feed(chunk)
+
+    async def _verify_one(semaphore, target, role):
+        """One delegated verification as a coroutine."""
+        lines = []
+        script_path, failure = _resolve_hook(target, role, announce=lines)
+        if script_path is None:
+            sys.stdout.write("\n".join(lines) + "\n")
+            return target, role, failure
+
+        # Trim through the same bounded capture the blocking path uses, so
+        # ledger records stay capped regardless of which runner produced
+        # them. Feeding it chunk-by-chunk (rather than communicate(), which
+        # buffers each hook's whole output before the trim) keeps memory
+        # O(1) in output size here too — with --jobs hooks running at once,
+        # a single verbose hook must not be able to balloon the sweep's RSS.
+        cap_out, cap_err = _BoundedCapture(), _BoundedCapture()
+        async with semaphore:
+            sys.stdout.write(f"🚀 [{role}] Executing: {script_path}\n")
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    script_path,
+                    cwd=target,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                await asyncio.gather(
+                    _drain(proc.stdout, cap_out), _drain(proc.stderr, cap_err))
+                await proc.wait()
+            except Exception as e:
+                print(f"❌ Execution Error: {e}")
+                return target, role, (False, "error", {"error": str(e)})
+
+        details = {
+            "hook": os.path.basename(script_path),
+            "exit_code": proc.returncode,
+            "stdout": cap_out.text(),
+            "stderr": cap_err.text()
+        }
+        status = "success" if proc.returncode == 0 else "failure"
+        return target, role, (proc.returncode == 0, status, details)
+
+    async def _sweep():
+        semaphore = asyncio.Semaphore(jobs)
+        # return_exceptions: one coroutine blowing up must not cancel the
+        # rest of the sweep — each crash becomes that task's own result.
+        return await asyncio.gather(
+            *[_verify_one(semaphore, target, role) for target, role in tasks],
+            return_exceptions=True)
+
+    failures = 0
+    # gather preserves submission order, so results line up with tasks —
+    # which is how a crashed coroutine's (target, role) is recovered.
+    for (target, role), result in zip(tasks, asyncio.run(_sweep())):
+        if isinstance(result, BaseException):
+            print(f"❌ [{role}] Task error for {target}: {result}")
+            success, status, details = False, "error", {"error": str(result)}
+        else:
+            target, role, (success, status, details) = result
+        if details is not None:
+            log_proof(target, role, f"delegate_{role}", status, details)
+        if not success:
+            failures += 1
+
+    print(f"🏁 Sweep complete: {len(tasks) - failures}/{len(tasks)} verifications passed.")
+    return failures == 0
+
+_USAGE = (
+    "usage: verify_rig.py --target PATH --role {gauger,spotter,watchdog}\n"
+    "       verify_rig.py --targets PATH [PATH ...] --roles ROLE [ROLE ...]\n"
+    "                     [--jobs N] [--async]\n"
+    "options: --ledger-format {jsonl,framed}   (default: jsonl)\n"
+)
 
 def main():
     """
     CLI Entry Point.
     Parses arguments -> Dispatches to Delegator -> Exits with Status Code.
+
+    The flags are parsed by hand: argparse's generic machinery (plus its
+    gettext/re import chain) costs more at startup than the whole parse is
+    worth. Both `--flag value` and `--flag=value` spellings are accepted,
+    matching what argparse offered before.
+
+    Two modes:
+      --target PATH --role ROLE                  one verification (as always)
+      --targets P1 P2 ... --roles R1 ... [--jobs N]   parallel sweep
     """
-    parser = argparse.ArgumentParser(description='OpenTruth Verification CLI (Delegator)')
-    
-    # --target: Mandatory. Which folder are we checking?
-    parser.add_argument('--target', required=True, help='Path to the Rig/Repo to verify')
-    
-    # --role: Mandatory. Who is checking it? Added 'watchdog'.
-    parser.add_argument('--role', choices=['gauger', 'spotter', 'watchdog'], required=True, help='Agent Role')
-    
-    args = parser.parse_args()
-    
-    # Pre-flight Check: Does the target exist?
-    if not os.path.exists(args.target):
-        print(f"❌ Target path not found: {args.target}")
-        sys.exit(1)
+    # A fresh CLI run must observe the filesystem as it is NOW — drop any
+    # hook locations memoized by a previous in-process invocation.
+    find_executable.cache_clear()
+
+    target = role = None
+    targets = []
+    roles = []
+    jobs = None
+    use_async = False
+    ledger_format = None
+
+    def _consume_values(token_iter, sink):
+        """Consumes tokens into sink until the next --flag; returns it."""
+        for value in token_iter:
+            if value.startswith("--"):
+                return value
+            sink.append(value)
+        return None
+
+    tokens = iter(sys.argv[1:])
+    token = next(tokens, None)
+    while token is not None:
+        if token == "--target":
+            target = next(tokens, None)
+        elif token.startswith("--target="):
+            target = token.partition("=")[2]
+        elif token == "--role":
+            role = next(tokens, None)
+        elif token.startswith("--role="):
+            role = token.partition("=")[2]
+        elif token == "--targets":
+            # Repeatable: swallow every value up to the next flag.
+            token = _consume_values(tokens, targets)
+            continue
+        elif token == "--roles":
+            token = _consume_values(tokens, roles)
+            continue
+        elif token == "--jobs":
+            jobs = next(tokens, None)
+        elif token.startswith("--jobs="):
+            jobs = token.partition("=")[2]
+        elif token == "--async":
+            use_async = True
+        elif token == "--ledger-format":
+            ledger_format = next(tokens, None)
+        elif token.startswith("--ledger-format="):
+            ledger_format = token.partition("=")[2]
+        elif token in ("-h", "--help"):
+            print(__doc__)
+            return
+        else:
+            sys.stderr.write(f"❌ Unknown argument: {token}\n" + _USAGE)
+            sys.exit(2)
+        token = next(tokens, None)
+
+    # Ledger encoding must be fixed before the first proof is queued.
+    if ledger_format is not None:
+        if ledger_format not in ("jsonl", "framed"):
+            sys.stderr.write("❌ --ledger-format expects jsonl or framed\n" + _USAGE)
+            sys.exit(2)
+        _LEDGER.format = ledger_format
+
+    # --- Sweep Mode ---
+    if targets:
+        sweep_roles = roles or ([role] if role else [])
+        if not sweep_roles or any(r not in _ROLES for r in sweep_roles):
+            sys.stderr.write(_USAGE)
+            sys.exit(2)
+        try:
+            jobs = int(jobs) if jobs is not None else (os.cpu_count() or 1)
+        except ValueError:
+            sys.stderr.write("❌ --jobs expects an integer\n" + _USAGE)
+            sys.exit(2)
+        # Guard both runners: ProcessPoolExecutor raises an ugly ValueError
+        # on max_workers=0, and asyncio.Semaphore(0) would deadlock the
+        # sweep outright (no coroutine could ever acquire it).
+        if jobs < 1:
+            sys.stderr.write("❌ --jobs expects a positive integer\n" + _USAGE)
+            sys.exit(2)
+
+        runner = run_batch_async if use_async else run_batch
+        swept = runner(targets, sweep_roles, jobs)
+        if not _drain_ledger() or not swept:
+            sys.exit(1)
+        return
+
+    # --- Single-Target Mode ---
+    # Both flags are mandatory, and --role must name a known agent role.
+    if not target or role not in _ROLES:
+        sys.stderr.write(_USAGE)
+        sys.exit(2)
+
+    # No pre-flight stat of the target here: run_delegated_check's single
+    # directory scan doubles as the existence check, and a missing target
+    # is reported from its failure path instead.
 
     # Run the logic
-    success = run_delegated_check(args.target, args.role)
-        
-    # Exit with appropriate code (0=Good, 1=Bad)
-    if not success:
-        print(f"❌ {args.role.capitalize()} verification failed.")
+    success = run_delegated_check(target, role)
+
+    # Exit with appropriate code (0=Good, 1=Bad). A proof that never
+    # reached the ledger fails the run even if the hook itself passed.
+    if not _drain_ledger() or not success:
+        print(f"❌ {role.capitalize()} verification failed.")
         sys.exit(1)
-        
-    print(f"✅ {args.role.capitalize()} verification passed!")
+
+    print(f"✅ {role.capitalize()} verification passed!")
 
 if __name__ == "__main__":
     main()
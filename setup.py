@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Optional Compiled Build (Cold-Start Reduction)
+----------------------------------------------
+The OpenTruth scripts run fine as plain Python — nothing in the Town
+requires this file. But for fleets where agents fork `opentruth_cli.py`
+thousands of times per investigation, the dominant per-invocation cost is
+interpreter startup, and compiling the CLI + bead adapter to C extension
+modules shaves a consistent slice off it.
+
+    python setup.py build_ext --inplace
+
+Produces `opentruth_cli.*.so` and `ot_to_bead.*.so` next to the sources.
+The pure-Python files stay in place as the fallback (and as the source of
+truth) — deployments without Cython lose nothing.
+
+Deliberately NOT compiled: `verify_rig.py`. Its runtime is dominated by
+the delegated subprocess and pipe I/O, where a compiled wrapper buys
+nothing.
+"""
+
+from setuptools import setup
+
+# Cython is an optional build dependency: without it we ship a plain
+# (extension-free) distribution and every script runs from source.
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["bin/opentruth_cli.py", "scripts/ot_to_bead.py"],
+        language_level=3,
+    )
+except ImportError:
+    ext_modules = []
+
+setup(
+    name="opentruth-gastown",
+    version="0.1.0",
+    description="OpenTruth Framework integration tools for Gastown swarms",
+    ext_modules=ext_modules,
+)